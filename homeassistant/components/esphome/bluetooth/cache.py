@@ -4,6 +4,7 @@ from __future__ import annotations
 from collections.abc import MutableMapping
 from dataclasses import dataclass, field
 
+from aioesphomeapi.model import BluetoothGATTService
 from bleak.backends.service import BleakGATTServiceCollection
 from lru import LRU  # pylint: disable=no-name-in-module
 
@@ -17,6 +18,9 @@ class ESPHomeBluetoothCache:
     _gatt_services_cache: MutableMapping[int, BleakGATTServiceCollection] = field(
         default_factory=lambda: LRU(MAX_CACHED_SERVICES)
     )
+    _gatt_raw_services_cache: MutableMapping[
+        int, tuple[int, list[BluetoothGATTService]]
+    ] = field(default_factory=lambda: LRU(MAX_CACHED_SERVICES))
     _gatt_mtu_cache: MutableMapping[int, int] = field(
         default_factory=lambda: LRU(MAX_CACHED_SERVICES)
     )
@@ -36,6 +40,19 @@ class ESPHomeBluetoothCache:
     def clear_gatt_services_cache(self, address: int) -> None:
         """Clear the BleakGATTServiceCollection for the given address."""
         self._gatt_services_cache.pop(address, None)
+        self._gatt_raw_services_cache.pop(address, None)
+
+    def get_gatt_raw_services_cache(
+        self, address: int
+    ) -> tuple[int, list[BluetoothGATTService]] | None:
+        """Get the mtu and raw services the cached collection was built from."""
+        return self._gatt_raw_services_cache.get(address)
+
+    def set_gatt_raw_services_cache(
+        self, address: int, mtu: int, services: list[BluetoothGATTService]
+    ) -> None:
+        """Set the mtu and raw services the cached collection was built from."""
+        self._gatt_raw_services_cache[address] = (mtu, services)
 
     def get_gatt_mtu_cache(self, address: int) -> int | None:
         """Get the mtu cache for the given address."""
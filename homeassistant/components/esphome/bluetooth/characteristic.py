@@ -8,6 +8,8 @@ from aioesphomeapi.model import BluetoothGATTCharacteristic
 from bleak.backends.characteristic import BleakGATTCharacteristic
 from bleak.backends.descriptor import BleakGATTDescriptor
 
+from .descriptor import BleakGATTDescriptorESPHome
+
 PROPERTY_MASKS = {
     2**n: prop
     for n, prop in enumerate(
@@ -41,7 +43,7 @@ class BleakGATTCharacteristicESPHome(BleakGATTCharacteristic):
     ) -> None:
         """Init a BleakGATTCharacteristicESPHome."""
         super().__init__(obj, max_write_without_response_size)
-        self.__descriptors: list[BleakGATTDescriptor] = []
+        self.__descriptors: list[BleakGATTDescriptor] | None = None
         self.__service_uuid: str = service_uuid
         self.__service_handle: int = service_handle
         char_props = self.obj.properties
@@ -76,7 +78,17 @@ class BleakGATTCharacteristicESPHome(BleakGATTCharacteristic):
 
     @property
     def descriptors(self) -> list[BleakGATTDescriptor]:
-        """List of descriptors for this service."""
+        """List of descriptors for this service.
+
+        The descriptors are built on first access since most
+        characteristics never have their descriptors used.
+        """
+        if self.__descriptors is None:
+            obj = self.obj
+            self.__descriptors = [
+                BleakGATTDescriptorESPHome(descriptor, obj.uuid, obj.handle)
+                for descriptor in obj.descriptors
+            ]
         return self.__descriptors
 
     def get_descriptor(self, specifier: int | str | UUID) -> BleakGATTDescriptor | None:
@@ -92,4 +104,7 @@ class BleakGATTCharacteristicESPHome(BleakGATTCharacteristic):
 
         Should not be used by end user, but rather by `bleak` itself.
         """
-        self.__descriptors.append(descriptor)
+        descriptors = self.descriptors
+        handle = descriptor.handle
+        if not any(existing.handle == handle for existing in descriptors):
+            descriptors.append(descriptor)
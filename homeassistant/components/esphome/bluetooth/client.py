@@ -5,11 +5,12 @@ import asyncio
 from collections.abc import Callable, Coroutine
 import contextlib
 from dataclasses import dataclass, field
-from functools import partial
+from functools import lru_cache, partial
 import logging
 import sys
-from typing import Any, TypeVar, cast
+from typing import Any, NoReturn, TypeVar, cast
 import uuid
+import weakref
 
 if sys.version_info < (3, 12):
     from typing_extensions import Buffer
@@ -41,10 +42,9 @@ from homeassistant.core import CALLBACK_TYPE
 
 from .cache import ESPHomeBluetoothCache
 from .characteristic import BleakGATTCharacteristicESPHome
-from .descriptor import BleakGATTDescriptorESPHome
 from .device import ESPHomeBluetoothDevice
 from .scanner import ESPHomeScanner
-from .service import BleakGATTServiceESPHome
+from .service import BleakGATTServiceCollectionESPHome, BleakGATTServiceESPHome
 
 DEFAULT_MTU = 23
 GATT_HEADER_SIZE = 3
@@ -62,71 +62,159 @@ _LOGGER = logging.getLogger(__name__)
 
 _WrapFuncType = TypeVar("_WrapFuncType", bound=Callable[..., Any])
 
+_NO_COLON = str.maketrans("", "", ":")
 
+# Map of connection error codes to their name and human readable description
+_CONNECTION_ERRORS: dict[int, tuple[str, str]] = {
+    error.value: (error.name, ESP_CONNECTION_ERROR_DESCRIPTION[error])
+    for error in BLEConnectionError
+    if error in ESP_CONNECTION_ERROR_DESCRIPTION
+}
+
+
+@lru_cache(maxsize=512)
 def mac_to_int(address: str) -> int:
     """Convert a mac address to an integer."""
-    return int(address.replace(":", ""), 16)
+    return int.from_bytes(bytes.fromhex(address.translate(_NO_COLON)), "big")
+
+
+def _as_bytes(data: Buffer) -> bytes:
+    """Return data as bytes, without calling bytes() if it already is."""
+    return data if type(data) is bytes else bytes(data)  # noqa: E721
+
+
+def _make_notify_trampoline(
+    callback: NotifyCallback,
+) -> Callable[[int, bytearray], None]:
+    """Adapt a bleak notify callback to the aioesphomeapi signature."""
+
+    def _on_notify(
+        handle: int, data: bytearray, _callback: NotifyCallback = callback
+    ) -> None:
+        # The callback is bound as a default argument so it is
+        # loaded as a fast local instead of through a closure cell
+        _callback(data)
+
+    return _on_notify
+
+
+def _abort_notifications(notify_aborts: dict[int, Callable[[], None]]) -> None:
+    """Abort all active notifications."""
+    for notify_abort in notify_aborts.values():
+        notify_abort()
+    notify_aborts.clear()
+
+
+def _esphome_client_finalized(
+    loop: asyncio.AbstractEventLoop,
+    log_prefix: str,
+    notify_aborts: dict[int, Callable[[], None]],
+) -> None:
+    """Clean up a client that was garbage collected while still connected.
+
+    Must not reference the client since it has already been collected.
+    """
+    _LOGGER.warning(
+        (
+            "%s: ESPHomeClient bleak client was not properly"
+            " disconnected before destruction"
+        ),
+        log_prefix,
+    )
+    if not loop.is_closed():
+        loop.call_soon_threadsafe(_abort_notifications, notify_aborts)
+
+
+def _raise_not_connected(client: ESPHomeClient) -> NoReturn:
+    """Raise a BleakError because the client is not connected."""
+    # pylint: disable=protected-access
+    raise BleakError(f"{client._log_prefix}: Not connected")
+
+
+def _api_error_as_bleak_error(
+    client: ESPHomeClient, func: Callable[..., Any], err: APIConnectionError
+) -> Exception:
+    """Convert an esphome api error to the exception bleak consumers expect."""
+    if isinstance(err, TimeoutAPIError):
+        return asyncio.TimeoutError(str(err))
+    if isinstance(err, BluetoothGATTAPIError) and err.error.error == -1:
+        # If the device disconnects in the middle of an operation
+        # be sure to mark it as disconnected so any library using
+        # the proxy knows to reconnect.
+        #
+        # Because callbacks are delivered asynchronously it's possible
+        # that we find out about the disconnection during the operation
+        # before the callback is delivered.
+        # pylint: disable=protected-access
+        _LOGGER.debug(
+            "%s: BLE device disconnected during %s operation",
+            client._log_prefix,
+            func.__name__,
+        )
+        client._async_ble_device_disconnected()
+    return BleakError(str(err))
+
+
+def api_error_as_bleak_error(func: _WrapFuncType) -> _WrapFuncType:
+    """Define a wrapper throw esphome api errors as BleakErrors."""
+
+    async def _async_wrap_bluetooth_operation(
+        self: ESPHomeClient, *args: Any, **kwargs: Any
+    ) -> Any:
+        try:
+            return await func(self, *args, **kwargs)
+        except APIConnectionError as err:
+            raise _api_error_as_bleak_error(self, func, err) from err
+
+    return cast(_WrapFuncType, _async_wrap_bluetooth_operation)
 
 
-def verify_connected(func: _WrapFuncType) -> _WrapFuncType:
-    """Define a wrapper throw BleakError if not connected."""
+def bluetooth_operation(func: _WrapFuncType) -> _WrapFuncType:
+    """Define a wrapper for an operation that requires a connection.
+
+    Throws BleakError if not connected or if the device disconnects
+    during the operation, and converts esphome api errors to BleakErrors.
+    """
 
     async def _async_wrap_bluetooth_connected_operation(
         self: ESPHomeClient, *args: Any, **kwargs: Any
     ) -> Any:
         # pylint: disable=protected-access
-        loop = self._loop
-        disconnected_futures = self._disconnected_futures
-        disconnected_future = loop.create_future()
-        disconnected_futures.add(disconnected_future)
-        ble_device = self._ble_device
-        disconnect_message = (
-            f"{self._source_name }: {ble_device.name} - {ble_device.address}: "
-            "Disconnected during operation"
-        )
-        try:
-            async with interrupt(disconnected_future, BleakError, disconnect_message):
+        if not self._is_connected:
+            _raise_not_connected(self)
+        # All in-flight operations share the same future which is resolved
+        # and replaced when the device disconnects
+        async with interrupt(
+            self._disconnected_future, BleakError, self._disconnect_message
+        ):
+            try:
                 return await func(self, *args, **kwargs)
-        finally:
-            disconnected_futures.discard(disconnected_future)
+            except APIConnectionError as err:
+                raise _api_error_as_bleak_error(self, func, err) from err
 
     return cast(_WrapFuncType, _async_wrap_bluetooth_connected_operation)
 
 
-def api_error_as_bleak_error(func: _WrapFuncType) -> _WrapFuncType:
-    """Define a wrapper throw esphome api errors as BleakErrors."""
+def bluetooth_operation_fast(func: _WrapFuncType) -> _WrapFuncType:
+    """Define a wrapper for a short operation that requires a connection.
 
-    async def _async_wrap_bluetooth_operation(
+    Unlike bluetooth_operation, this does not race the operation against
+    a disconnect and should only be used for short operations where the
+    api call itself will fail if the device disconnects.
+    """
+
+    async def _async_wrap_bluetooth_connected_fast_operation(
         self: ESPHomeClient, *args: Any, **kwargs: Any
     ) -> Any:
+        # pylint: disable=protected-access
+        if not self._is_connected:
+            _raise_not_connected(self)
         try:
             return await func(self, *args, **kwargs)
-        except TimeoutAPIError as err:
-            raise asyncio.TimeoutError(str(err)) from err
-        except BluetoothGATTAPIError as ex:
-            # If the device disconnects in the middle of an operation
-            # be sure to mark it as disconnected so any library using
-            # the proxy knows to reconnect.
-            #
-            # Because callbacks are delivered asynchronously it's possible
-            # that we find out about the disconnection during the operation
-            # before the callback is delivered.
-
-            if ex.error.error == -1:
-                # pylint: disable=protected-access
-                _LOGGER.debug(
-                    "%s: %s - %s: BLE device disconnected during %s operation",
-                    self._source_name,
-                    self._ble_device.name,
-                    self._ble_device.address,
-                    func.__name__,
-                )
-                self._async_ble_device_disconnected()
-            raise BleakError(str(ex)) from ex
         except APIConnectionError as err:
-            raise BleakError(str(err)) from err
+            raise _api_error_as_bleak_error(self, func, err) from err
 
-    return cast(_WrapFuncType, _async_wrap_bluetooth_operation)
+    return cast(_WrapFuncType, _async_wrap_bluetooth_connected_fast_operation)
 
 
 @dataclass(slots=True)
@@ -140,12 +228,40 @@ class ESPHomeClientData:
     api_version: APIVersion
     title: str
     scanner: ESPHomeScanner | None
-    disconnect_callbacks: list[Callable[[], None]] = field(default_factory=list)
+    disconnect_callbacks: set[Callable[[], None]] = field(default_factory=set)
 
 
 class ESPHomeClient(BaseBleakClient):
     """ESPHome Bleak Client."""
 
+    # BaseBleakClient does not define __slots__ so its own attributes
+    # still live in __dict__, but the attributes read on every GATT
+    # operation are slot descriptors.
+    __slots__ = (
+        "_disconnect_callbacks",
+        "_loop",
+        "_ble_device",
+        "_address_as_int",
+        "_source",
+        "_cache",
+        "_bluetooth_device",
+        "_client",
+        "_is_connected",
+        "_mtu",
+        "_cancel_connection_state",
+        "_notify_stops",
+        "_notify_aborts",
+        "_disconnected_future",
+        "_device_info",
+        "_feature_flags",
+        "_address_type",
+        "_source_name",
+        "_log_prefix",
+        "_disconnect_message",
+        "_scanner",
+        "_finalizer",
+    )
+
     def __init__(
         self,
         address_or_ble_device: BLEDevice | str,
@@ -160,28 +276,34 @@ class ESPHomeClient(BaseBleakClient):
         super().__init__(address_or_ble_device, *args, **kwargs)
         self._loop = asyncio.get_running_loop()
         self._ble_device = address_or_ble_device
-        self._address_as_int = mac_to_int(self._ble_device.address)
-        assert self._ble_device.details is not None
-        self._source = self._ble_device.details["source"]
+        self._address_as_int = mac_to_int(address_or_ble_device.address)
+        details = address_or_ble_device.details
+        assert details is not None
+        self._source = details["source"]
         self._cache = client_data.cache
         self._bluetooth_device = client_data.bluetooth_device
         self._client = client_data.client
         self._is_connected = False
         self._mtu: int | None = None
         self._cancel_connection_state: CALLBACK_TYPE | None = None
-        self._notify_cancels: dict[
-            int, tuple[Callable[[], Coroutine[Any, Any, None]], Callable[[], None]]
-        ] = {}
-        self._disconnected_futures: set[asyncio.Future[None]] = set()
+        self._notify_stops: dict[int, Callable[[], Coroutine[Any, Any, None]]] = {}
+        self._notify_aborts: dict[int, Callable[[], None]] = {}
+        self._disconnected_future: asyncio.Future[None] = self._loop.create_future()
         self._device_info = client_data.device_info
         self._feature_flags = device_info.bluetooth_proxy_feature_flags_compat(
             client_data.api_version
         )
-        self._address_type = address_or_ble_device.details["address_type"]
+        self._address_type = details["address_type"]
         self._source_name = f"{client_data.title} [{self._source}]"
+        self._log_prefix = (
+            f"{self._source_name}: {address_or_ble_device.name} - "
+            f"{address_or_ble_device.address}"
+        )
+        self._disconnect_message = f"{self._log_prefix}: Disconnected during operation"
         scanner = client_data.scanner
         assert scanner is not None
         self._scanner = scanner
+        self._finalizer: weakref.finalize | None = None
 
     def __str__(self) -> str:
         """Return the string representation of the client."""
@@ -196,12 +318,10 @@ class ESPHomeClient(BaseBleakClient):
         except (AssertionError, ValueError) as ex:
             _LOGGER.debug(
                 (
-                    "%s: %s - %s: Failed to unsubscribe from connection state (likely"
+                    "%s: Failed to unsubscribe from connection state (likely"
                     " connection dropped): %s"
                 ),
-                self._source_name,
-                self._ble_device.name,
-                self._ble_device.address,
+                self._log_prefix,
                 ex,
             )
         self._cancel_connection_state = None
@@ -210,14 +330,16 @@ class ESPHomeClient(BaseBleakClient):
         """Clean up on disconnect."""
         self.services = BleakGATTServiceCollection()  # type: ignore[no-untyped-call]
         self._is_connected = False
-        for _, notify_abort in self._notify_cancels.values():
-            notify_abort()
-        self._notify_cancels.clear()
-        for future in self._disconnected_futures:
-            if not future.done():
-                future.set_result(None)
-        self._disconnected_futures.clear()
+        _abort_notifications(self._notify_aborts)
+        self._notify_stops.clear()
+        disconnected_future = self._disconnected_future
+        if not disconnected_future.done():
+            disconnected_future.set_result(None)
+        self._disconnected_future = self._loop.create_future()
         self._unsubscribe_connection_state()
+        if self._finalizer:
+            self._finalizer.detach()
+            self._finalizer = None
 
     def _async_ble_device_disconnected(self) -> None:
         """Handle the BLE device disconnecting from the ESP."""
@@ -225,22 +347,18 @@ class ESPHomeClient(BaseBleakClient):
         self._async_disconnected_cleanup()
         if was_connected:
             _LOGGER.debug(
-                "%s: %s - %s: BLE device disconnected",
-                self._source_name,
-                self._ble_device.name,
-                self._ble_device.address,
+                "%s: BLE device disconnected",
+                self._log_prefix,
             )
             self._async_call_bleak_disconnected_callback()
 
     def _async_esp_disconnected(self) -> None:
         """Handle the esp32 client disconnecting from us."""
         _LOGGER.debug(
-            "%s: %s - %s: ESP device disconnected",
-            self._source_name,
-            self._ble_device.name,
-            self._ble_device.address,
+            "%s: ESP device disconnected",
+            self._log_prefix,
         )
-        self._disconnect_callbacks.remove(self._async_esp_disconnected)
+        self._disconnect_callbacks.discard(self._async_esp_disconnected)
         self._async_ble_device_disconnected()
 
     def _async_call_bleak_disconnected_callback(self) -> None:
@@ -258,10 +376,8 @@ class ESPHomeClient(BaseBleakClient):
     ) -> None:
         """Handle a connect or disconnect."""
         _LOGGER.debug(
-            "%s: %s - %s: Connection state changed to connected=%s mtu=%s error=%s",
-            self._source_name,
-            self._ble_device.name,
-            self._ble_device.address,
+            "%s: Connection state changed to connected=%s mtu=%s error=%s",
+            self._log_prefix,
             connected,
             mtu,
             error,
@@ -278,11 +394,9 @@ class ESPHomeClient(BaseBleakClient):
             return
 
         if error:
-            try:
-                ble_connection_error = BLEConnectionError(error)
-                ble_connection_error_name = ble_connection_error.name
-                human_error = ESP_CONNECTION_ERROR_DESCRIPTION[ble_connection_error]
-            except (KeyError, ValueError):
+            if connection_error := _CONNECTION_ERRORS.get(error):
+                ble_connection_error_name, human_error = connection_error
+            else:
                 ble_connection_error_name = str(error)
                 human_error = ESPHOME_GATT_ERRORS.get(
                     error, f"Unknown error code {error}"
@@ -300,12 +414,10 @@ class ESPHomeClient(BaseBleakClient):
             return
 
         _LOGGER.debug(
-            "%s: %s - %s: connected, registering for disconnected callbacks",
-            self._source_name,
-            self._ble_device.name,
-            self._ble_device.address,
+            "%s: connected, registering for disconnected callbacks",
+            self._log_prefix,
         )
-        self._disconnect_callbacks.append(self._async_esp_disconnected)
+        self._disconnect_callbacks.add(self._async_esp_disconnected)
         connected_future.set_result(connected)
 
     @api_error_as_bleak_error
@@ -321,7 +433,8 @@ class ESPHomeClient(BaseBleakClient):
         Returns:
             Boolean representing connection status.
         """
-        await self._wait_for_free_connection_slot(CONNECT_FREE_SLOT_TIMEOUT)
+        if not self._bluetooth_device.ble_connections_free:
+            await self._wait_for_free_connection_slot(CONNECT_FREE_SLOT_TIMEOUT)
         cache = self._cache
 
         self._mtu = cache.get_gatt_mtu_cache(self._address_as_int)
@@ -346,6 +459,19 @@ class ESPHomeClient(BaseBleakClient):
                         address_type=self._address_type,
                     )
                 )
+                if not self._finalizer:
+                    # Warn and abort notifications if the client is garbage
+                    # collected without being disconnected first
+                    self._finalizer = weakref.finalize(
+                        self,
+                        _esphome_client_finalized,
+                        self._loop,
+                        self._log_prefix,
+                        self._notify_aborts,
+                    )
+                    # Clients that are still connected at shutdown
+                    # were not leaked so there is nothing to warn about
+                    self._finalizer.atexit = False
             except asyncio.CancelledError:
                 if connected_future.done():
                     with contextlib.suppress(BleakError):
@@ -394,19 +520,22 @@ class ESPHomeClient(BaseBleakClient):
     async def _disconnect(self) -> bool:
         self._async_disconnected_cleanup()
         await self._client.bluetooth_device_disconnect(self._address_as_int)
-        await self._wait_for_free_connection_slot(DISCONNECT_TIMEOUT)
+        if not self._bluetooth_device.ble_connections_free:
+            await self._wait_for_free_connection_slot(DISCONNECT_TIMEOUT)
         return True
 
     async def _wait_for_free_connection_slot(self, timeout: float) -> None:
-        """Wait for a free connection slot."""
+        """Wait for a free connection slot.
+
+        Callers check ble_connections_free first to avoid
+        the coroutine overhead when a slot is already free.
+        """
         bluetooth_device = self._bluetooth_device
         if bluetooth_device.ble_connections_free:
             return
         _LOGGER.debug(
-            "%s: %s - %s: Out of connection slots, waiting for a free one",
-            self._source_name,
-            self._ble_device.name,
-            self._ble_device.address,
+            "%s: Out of connection slots, waiting for a free one",
+            self._log_prefix,
         )
         async with asyncio.timeout(timeout):
             await bluetooth_device.wait_for_ble_connections_free()
@@ -421,8 +550,7 @@ class ESPHomeClient(BaseBleakClient):
         """Get ATT MTU size for active connection."""
         return self._mtu or DEFAULT_MTU
 
-    @verify_connected
-    @api_error_as_bleak_error
+    @bluetooth_operation
     async def pair(self, *args: Any, **kwargs: Any) -> bool:
         """Attempt to pair."""
         if not self._feature_flags & BluetoothProxyFeature.PAIRING:
@@ -438,8 +566,7 @@ class ESPHomeClient(BaseBleakClient):
         )
         return False
 
-    @verify_connected
-    @api_error_as_bleak_error
+    @bluetooth_operation
     async def unpair(self) -> bool:
         """Attempt to unpair."""
         if not self._feature_flags & BluetoothProxyFeature.PAIRING:
@@ -469,7 +596,7 @@ class ESPHomeClient(BaseBleakClient):
             dangerous_use_bleak_cache=dangerous_use_bleak_cache, **kwargs
         )
 
-    @verify_connected
+    @bluetooth_operation
     async def _get_services(
         self, dangerous_use_bleak_cache: bool = False, **kwargs: Any
     ) -> BleakGATTServiceCollection:
@@ -487,32 +614,48 @@ class ESPHomeClient(BaseBleakClient):
             or dangerous_use_bleak_cache
         ) and (cached_services := cache.get_gatt_services_cache(address_as_int)):
             _LOGGER.debug(
-                "%s: %s - %s: Cached services hit",
-                self._source_name,
-                self._ble_device.name,
-                self._ble_device.address,
+                "%s: Cached services hit",
+                self._log_prefix,
             )
             self.services = cached_services
             return self.services
         _LOGGER.debug(
-            "%s: %s - %s: Cached services miss",
-            self._source_name,
-            self._ble_device.name,
-            self._ble_device.address,
+            "%s: Cached services miss",
+            self._log_prefix,
         )
         esphome_services = await self._client.bluetooth_gatt_get_services(
             address_as_int
         )
         _LOGGER.debug(
-            "%s: %s - %s: Got services: %s",
-            self._source_name,
-            self._ble_device.name,
-            self._ble_device.address,
+            "%s: Got services: %s",
+            self._log_prefix,
             esphome_services,
         )
-        max_write_without_response = self.mtu_size - GATT_HEADER_SIZE
-        services = BleakGATTServiceCollection()  # type: ignore[no-untyped-call]
-        for service in esphome_services.services:
+        if not esphome_services.services:
+            # If we got no services, we must have disconnected
+            # or something went wrong on the ESP32's BLE stack.
+            raise BleakError("Failed to get services from remote esp")
+
+        mtu_size = self.mtu_size
+        raw_services = esphome_services.services
+        raw_services_key = (mtu_size, raw_services)
+        if cache.get_gatt_raw_services_cache(address_as_int) == raw_services_key and (
+            cached_services := cache.get_gatt_services_cache(address_as_int)
+        ):
+            # The device returned the same services as the last time we
+            # built the collection so we can reuse it instead of
+            # creating all the service, characteristic and descriptor
+            # objects again.
+            _LOGGER.debug(
+                "%s: Services unchanged, reusing cached services",
+                self._log_prefix,
+            )
+            self.services = cached_services
+            return cached_services
+
+        max_write_without_response = mtu_size - GATT_HEADER_SIZE
+        services = BleakGATTServiceCollectionESPHome()
+        for service in raw_services:
             services.add_service(BleakGATTServiceESPHome(service))
             for characteristic in service.characteristics:
                 services.add_characteristic(
@@ -523,28 +666,14 @@ class ESPHomeClient(BaseBleakClient):
                         service.handle,
                     )
                 )
-                for descriptor in characteristic.descriptors:
-                    services.add_descriptor(
-                        BleakGATTDescriptorESPHome(
-                            descriptor,
-                            characteristic.uuid,
-                            characteristic.handle,
-                        )
-                    )
-
-        if not esphome_services.services:
-            # If we got no services, we must have disconnected
-            # or something went wrong on the ESP32's BLE stack.
-            raise BleakError("Failed to get services from remote esp")
 
         self.services = services
         _LOGGER.debug(
-            "%s: %s - %s: Cached services saved",
-            self._source_name,
-            self._ble_device.name,
-            self._ble_device.address,
+            "%s: Cached services saved",
+            self._log_prefix,
         )
         cache.set_gatt_services_cache(address_as_int, services)
+        cache.set_gatt_raw_services_cache(address_as_int, mtu_size, raw_services)
         return services
 
     def _resolve_characteristic(
@@ -553,15 +682,18 @@ class ESPHomeClient(BaseBleakClient):
         """Resolve a characteristic specifier to a BleakGATTCharacteristic object."""
         if (services := self.services) is None:
             raise BleakError("Services have not been resolved")
-        if not isinstance(char_specifier, BleakGATTCharacteristic):
-            characteristic = services.get_characteristic(char_specifier)
-        else:
+        if type(char_specifier) is int:  # noqa: E721
+            # Handle lookups are the common case, go straight to
+            # the collection's handle-keyed dict
+            characteristic = services.characteristics.get(char_specifier)
+        elif isinstance(char_specifier, BleakGATTCharacteristic):
             characteristic = char_specifier
+        else:
+            characteristic = services.get_characteristic(char_specifier)
         if not characteristic:
             raise BleakError(f"Characteristic {char_specifier} was not found!")
         return characteristic
 
-    @verify_connected
     @api_error_as_bleak_error
     async def clear_cache(self) -> bool:
         """Clear the GATT cache."""
@@ -585,8 +717,7 @@ class ESPHomeClient(BaseBleakClient):
         )
         return False
 
-    @verify_connected
-    @api_error_as_bleak_error
+    @bluetooth_operation
     async def read_gatt_char(
         self,
         char_specifier: BleakGATTCharacteristic | int | str | uuid.UUID,
@@ -609,8 +740,7 @@ class ESPHomeClient(BaseBleakClient):
             self._address_as_int, characteristic.handle, GATT_READ_TIMEOUT
         )
 
-    @verify_connected
-    @api_error_as_bleak_error
+    @bluetooth_operation
     async def read_gatt_descriptor(self, handle: int, **kwargs: Any) -> bytearray:
         """Perform read operation on the specified GATT descriptor.
 
@@ -625,8 +755,6 @@ class ESPHomeClient(BaseBleakClient):
             self._address_as_int, handle, GATT_READ_TIMEOUT
         )
 
-    @verify_connected
-    @api_error_as_bleak_error
     async def write_gatt_char(
         self,
         characteristic: BleakGATTCharacteristic | int | str | uuid.UUID,
@@ -644,13 +772,44 @@ class ESPHomeClient(BaseBleakClient):
             response (bool): If write-with-response operation should be done.
                 Defaults to `False`.
         """
+        if response:
+            await self._write_gatt_char_with_response(characteristic, data)
+        else:
+            await self._write_gatt_char_without_response(characteristic, data)
+
+    @bluetooth_operation
+    async def _write_gatt_char_with_response(
+        self,
+        characteristic: BleakGATTCharacteristic | int | str | uuid.UUID,
+        data: Buffer,
+    ) -> None:
+        """Write to a GATT characteristic and wait for the response.
+
+        The device may take a while to respond, so the write must
+        be interrupted if the device disconnects.
+        """
         characteristic = self._resolve_characteristic(characteristic)
         await self._client.bluetooth_gatt_write(
-            self._address_as_int, characteristic.handle, bytes(data), response
+            self._address_as_int, characteristic.handle, _as_bytes(data), True
         )
 
-    @verify_connected
-    @api_error_as_bleak_error
+    @bluetooth_operation_fast
+    async def _write_gatt_char_without_response(
+        self,
+        characteristic: BleakGATTCharacteristic | int | str | uuid.UUID,
+        data: Buffer,
+    ) -> None:
+        """Write to a GATT characteristic without waiting for a response.
+
+        The api sends the write without waiting, so there is
+        nothing to interrupt if the device disconnects.
+        """
+        characteristic = self._resolve_characteristic(characteristic)
+        await self._client.bluetooth_gatt_write(
+            self._address_as_int, characteristic.handle, _as_bytes(data), False
+        )
+
+    @bluetooth_operation
     async def write_gatt_descriptor(self, handle: int, data: Buffer) -> None:
         """Perform a write operation on the specified GATT descriptor.
 
@@ -659,11 +818,10 @@ class ESPHomeClient(BaseBleakClient):
             data (bytes or bytearray): The data to send.
         """
         await self._client.bluetooth_gatt_write_descriptor(
-            self._address_as_int, handle, bytes(data)
+            self._address_as_int, handle, _as_bytes(data)
         )
 
-    @verify_connected
-    @api_error_as_bleak_error
+    @bluetooth_operation
     async def start_notify(
         self,
         characteristic: BleakGATTCharacteristic,
@@ -690,7 +848,7 @@ class ESPHomeClient(BaseBleakClient):
             kwargs: Unused.
         """
         ble_handle = characteristic.handle
-        if ble_handle in self._notify_cancels:
+        if ble_handle in self._notify_stops:
             raise BleakError(
                 "Notifications are already enabled on "
                 f"service:{characteristic.service_uuid} "
@@ -706,13 +864,13 @@ class ESPHomeClient(BaseBleakClient):
                 " property set."
             )
 
-        self._notify_cancels[
-            ble_handle
-        ] = await self._client.bluetooth_gatt_start_notify(
+        notify_stop, notify_abort = await self._client.bluetooth_gatt_start_notify(
             self._address_as_int,
             ble_handle,
-            lambda handle, data: callback(data),
+            _make_notify_trampoline(callback),
         )
+        self._notify_stops[ble_handle] = notify_stop
+        self._notify_aborts[ble_handle] = notify_abort
 
         if not self._feature_flags & BluetoothProxyFeature.REMOTE_CACHING:
             return
@@ -731,12 +889,10 @@ class ESPHomeClient(BaseBleakClient):
 
         _LOGGER.debug(
             (
-                "%s: %s - %s: Writing to CCD descriptor %s for notifications with"
+                "%s: Writing to CCD descriptor %s for notifications with"
                 " properties=%s"
             ),
-            self._source_name,
-            self._ble_device.name,
-            self._ble_device.address,
+            self._log_prefix,
             cccd_descriptor.handle,
             characteristic.properties,
         )
@@ -748,8 +904,7 @@ class ESPHomeClient(BaseBleakClient):
             wait_for_response=False,
         )
 
-    @verify_connected
-    @api_error_as_bleak_error
+    @bluetooth_operation
     async def stop_notify(
         self,
         char_specifier: BleakGATTCharacteristic | int | str | uuid.UUID,
@@ -765,21 +920,7 @@ class ESPHomeClient(BaseBleakClient):
         characteristic = self._resolve_characteristic(char_specifier)
         # Do not raise KeyError if notifications are not enabled on this characteristic
         # to be consistent with the behavior of the BlueZ backend
-        if notify_cancel := self._notify_cancels.pop(characteristic.handle, None):
-            notify_stop, _ = notify_cancel
+        ble_handle = characteristic.handle
+        self._notify_aborts.pop(ble_handle, None)
+        if notify_stop := self._notify_stops.pop(ble_handle, None):
             await notify_stop()
-
-    def __del__(self) -> None:
-        """Destructor to make sure the connection state is unsubscribed."""
-        if self._cancel_connection_state:
-            _LOGGER.warning(
-                (
-                    "%s: %s - %s: ESPHomeClient bleak client was not properly"
-                    " disconnected before destruction"
-                ),
-                self._source_name,
-                self._ble_device.name,
-                self._ble_device.address,
-            )
-        if not self._loop.is_closed():
-            self._loop.call_soon_threadsafe(self._async_disconnected_cleanup)
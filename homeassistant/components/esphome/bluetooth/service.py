@@ -3,7 +3,8 @@ from __future__ import annotations
 
 from aioesphomeapi.model import BluetoothGATTService
 from bleak.backends.characteristic import BleakGATTCharacteristic
-from bleak.backends.service import BleakGATTService
+from bleak.backends.descriptor import BleakGATTDescriptor
+from bleak.backends.service import BleakGATTService, BleakGATTServiceCollection
 
 
 class BleakGATTServiceESPHome(BleakGATTService):
@@ -38,3 +39,35 @@ class BleakGATTServiceESPHome(BleakGATTService):
         Should not be used by end user, but rather by `bleak` itself.
         """
         self.__characteristics.append(characteristic)
+
+
+class BleakGATTServiceCollectionESPHome(BleakGATTServiceCollection):
+    """GATT Service Collection implementation for the ESPHome backend.
+
+    Descriptors are only built when they are first used, so they
+    are registered from the characteristics on first access.
+    """
+
+    def __init__(self) -> None:
+        """Init a BleakGATTServiceCollectionESPHome."""
+        super().__init__()  # type: ignore[no-untyped-call]
+        self.__descriptors_resolved = False
+
+    @property
+    def descriptors(self) -> dict[int, BleakGATTDescriptor]:
+        """Return a dictionary of integer handles mapping to BleakGATTDescriptor."""
+        descriptors: dict[int, BleakGATTDescriptor] = super().descriptors
+        if not self.__descriptors_resolved:
+            self.__descriptors_resolved = True
+            for characteristic in self.characteristics.values():
+                for descriptor in characteristic.descriptors:
+                    descriptors.setdefault(descriptor.handle, descriptor)
+        return descriptors
+
+    def add_characteristic(self, characteristic: BleakGATTCharacteristic) -> None:
+        """Add a :py:class:`~BleakGATTCharacteristic` to the service collection.
+
+        Should not be used by end user, but rather by `bleak` itself.
+        """
+        super().add_characteristic(characteristic)
+        self.__descriptors_resolved = False
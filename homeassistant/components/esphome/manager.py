@@ -294,7 +294,7 @@ class ESPHomeManager:
                 event.data["entity_id"], attribute, new_state
             )
 
-        self.entry_data.disconnect_callbacks.append(
+        self.entry_data.disconnect_callbacks.add(
             async_track_state_change_event(
                 hass, [entity_id], send_home_assistant_state_event
             )
@@ -439,7 +439,7 @@ class ESPHomeManager:
             reconnect_logic.name = device_info.name
 
         if device_info.bluetooth_proxy_feature_flags_compat(cli.api_version):
-            entry_data.disconnect_callbacks.append(
+            entry_data.disconnect_callbacks.add(
                 await async_connect_scanner(
                     hass, entry, cli, entry_data, self.domain_data.bluetooth_cache
                 )
@@ -457,7 +457,7 @@ class ESPHomeManager:
             await cli.subscribe_home_assistant_states(self.async_on_state_subscription)
 
             if device_info.voice_assistant_version:
-                entry_data.disconnect_callbacks.append(
+                entry_data.disconnect_callbacks.add(
                     await cli.subscribe_voice_assistant(
                         self._handle_pipeline_start,
                         self._handle_pipeline_stop,
@@ -485,9 +485,9 @@ class ESPHomeManager:
             host,
             expected_disconnect,
         )
-        for disconnect_cb in entry_data.disconnect_callbacks:
+        for disconnect_cb in entry_data.disconnect_callbacks.copy():
             disconnect_cb()
-        entry_data.disconnect_callbacks = []
+        entry_data.disconnect_callbacks = set()
         entry_data.available = False
         entry_data.expected_disconnect = expected_disconnect
         # Mark state as stale so that we will always dispatch
@@ -746,9 +746,9 @@ async def cleanup_instance(hass: HomeAssistant, entry: ConfigEntry) -> RuntimeEn
     domain_data = DomainData.get(hass)
     data = domain_data.pop_entry_data(entry)
     data.available = False
-    for disconnect_cb in data.disconnect_callbacks:
+    for disconnect_cb in data.disconnect_callbacks.copy():
         disconnect_cb()
-    data.disconnect_callbacks = []
+    data.disconnect_callbacks = set()
     for cleanup_callback in data.cleanup_callbacks:
         cleanup_callback()
     await data.async_cleanup()
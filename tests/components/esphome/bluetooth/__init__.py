@@ -0,0 +1 @@
+"""Tests for the esphome bluetooth integration."""
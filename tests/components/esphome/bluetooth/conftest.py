@@ -0,0 +1,118 @@
+"""esphome bluetooth fixtures."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, Mock
+from uuid import UUID
+
+from aioesphomeapi import APIClient, APIVersion, BluetoothProxyFeature, DeviceInfo
+from aioesphomeapi.model import BluetoothGATTService, ESPHomeBluetoothGATTServices
+from bleak.backends.device import BLEDevice
+import pytest
+
+from homeassistant.components.esphome.bluetooth.cache import ESPHomeBluetoothCache
+from homeassistant.components.esphome.bluetooth.client import (
+    ESPHomeClient,
+    ESPHomeClientData,
+)
+from homeassistant.components.esphome.bluetooth.device import ESPHomeBluetoothDevice
+from homeassistant.core import HomeAssistant
+
+
+def split_uuid(short_uuid: str) -> list[int]:
+    """Split a 16 bit bluetooth uuid into the high and low parts esphome sends."""
+    value = UUID(f"0000{short_uuid}-0000-1000-8000-00805f9b34fb").int
+    return [value >> 64, value & ((1 << 64) - 1)]
+
+
+def make_esphome_services(
+    characteristic_uuid: str = "2a00",
+) -> ESPHomeBluetoothGATTServices:
+    """Make a service tree with one notify characteristic and its CCCD."""
+    return ESPHomeBluetoothGATTServices(
+        address=1,
+        services=[
+            BluetoothGATTService.from_dict(
+                {
+                    "uuid": split_uuid("1800"),
+                    "handle": 1,
+                    "characteristics": [
+                        {
+                            "uuid": split_uuid(characteristic_uuid),
+                            "handle": 2,
+                            "properties": 0x12,
+                            "descriptors": [{"uuid": split_uuid("2902"), "handle": 3}],
+                        }
+                    ],
+                }
+            )
+        ],
+    )
+
+
+@pytest.fixture
+def mock_api_client() -> Mock:
+    """Mock an APIClient connected to a bluetooth proxy."""
+    api_client = Mock(spec=APIClient)
+
+    async def _connect(
+        address: int, on_state: Callable[[bool, int, int], None], **kwargs: Any
+    ) -> Mock:
+        asyncio.get_running_loop().call_soon(on_state, True, 247, 0)
+        return Mock()
+
+    api_client.bluetooth_device_connect = AsyncMock(side_effect=_connect)
+    api_client.bluetooth_device_disconnect = AsyncMock()
+    api_client.bluetooth_device_clear_cache = AsyncMock(return_value=Mock(success=True))
+    api_client.bluetooth_gatt_get_services = AsyncMock(
+        side_effect=lambda address: make_esphome_services()
+    )
+    api_client.bluetooth_gatt_read = AsyncMock(return_value=bytearray(b"data"))
+    api_client.bluetooth_gatt_write = AsyncMock()
+    api_client.bluetooth_gatt_write_descriptor = AsyncMock()
+    api_client.bluetooth_gatt_start_notify = AsyncMock(
+        return_value=(AsyncMock(), Mock())
+    )
+    return api_client
+
+
+@pytest.fixture
+def feature_flags() -> BluetoothProxyFeature:
+    """Return the feature flags of the mocked bluetooth proxy."""
+    return (
+        BluetoothProxyFeature.PASSIVE_SCAN
+        | BluetoothProxyFeature.ACTIVE_CONNECTIONS
+        | BluetoothProxyFeature.CACHE_CLEARING
+    )
+
+
+@pytest.fixture
+async def client_data(
+    hass: HomeAssistant, mock_api_client: Mock, feature_flags: BluetoothProxyFeature
+) -> ESPHomeClientData:
+    """Return ESPHomeClientData for a mocked bluetooth proxy."""
+    device_info = Mock(spec=DeviceInfo)
+    device_info.name = "proxy"
+    device_info.bluetooth_proxy_feature_flags_compat.return_value = feature_flags
+    return ESPHomeClientData(
+        bluetooth_device=ESPHomeBluetoothDevice(
+            "proxy", "11:22:33:44:55:66", ble_connections_free=3
+        ),
+        cache=ESPHomeBluetoothCache(),
+        client=mock_api_client,
+        device_info=device_info,
+        api_version=APIVersion(1, 9),
+        title="proxy",
+        scanner=MagicMock(),
+    )
+
+
+@pytest.fixture
+async def esphome_client(client_data: ESPHomeClientData) -> ESPHomeClient:
+    """Return an ESPHomeClient for a mocked bluetooth proxy."""
+    ble_device = BLEDevice(
+        "AA:BB:CC:DD:EE:FF", "device", {"source": "proxy", "address_type": 0}, -60
+    )
+    return ESPHomeClient(ble_device, client_data=client_data)
@@ -0,0 +1,236 @@
+"""Test the ESPHome bluetooth client."""
+from __future__ import annotations
+
+import asyncio
+import gc
+from unittest.mock import AsyncMock, Mock
+
+from bleak.backends.device import BLEDevice
+from bleak.exc import BleakError
+import pytest
+
+from homeassistant.components.esphome.bluetooth.client import (
+    CCCD_UUID,
+    ESPHomeClient,
+    ESPHomeClientData,
+)
+from homeassistant.core import HomeAssistant
+
+from .conftest import make_esphome_services
+
+
+async def _hang(*args: object, **kwargs: object) -> None:
+    """Wait forever like an api call to a device that stopped responding."""
+    await asyncio.Event().wait()
+
+
+async def test_operation_requires_connection(esphome_client: ESPHomeClient) -> None:
+    """Test operations fail fast when the client is not connected."""
+    with pytest.raises(BleakError, match="Not connected"):
+        await esphome_client.read_gatt_descriptor(3)
+
+
+async def test_clear_cache_while_disconnected(
+    esphome_client: ESPHomeClient, mock_api_client: Mock
+) -> None:
+    """Test the cache can be cleared without a connection."""
+    assert await esphome_client.clear_cache() is True
+    mock_api_client.bluetooth_device_clear_cache.assert_awaited_once()
+
+
+async def test_disconnect_interrupts_operations(
+    esphome_client: ESPHomeClient, mock_api_client: Mock
+) -> None:
+    """Test a disconnect interrupts all in-flight operations."""
+    await esphome_client.connect()
+    mock_api_client.bluetooth_gatt_read.side_effect = _hang
+    mock_api_client.bluetooth_gatt_read_descriptor.side_effect = _hang
+    tasks = [
+        asyncio.create_task(esphome_client.read_gatt_char(2)),
+        asyncio.create_task(esphome_client.read_gatt_descriptor(3)),
+    ]
+    await asyncio.sleep(0)
+    disconnected_future = esphome_client._disconnected_future
+
+    esphome_client._async_ble_device_disconnected()
+    for task in tasks:
+        with pytest.raises(BleakError, match="Disconnected during operation"):
+            await asyncio.wait_for(task, 1)
+
+    assert disconnected_future.done()
+    assert not esphome_client._disconnected_future.done()
+
+    # The replacement future interrupts operations after a reconnect
+    await esphome_client.connect()
+    task = asyncio.create_task(esphome_client.read_gatt_char(2))
+    await asyncio.sleep(0)
+    esphome_client._async_ble_device_disconnected()
+    with pytest.raises(BleakError, match="Disconnected during operation"):
+        await asyncio.wait_for(task, 1)
+
+
+async def test_disconnect_interrupts_writes_waiting_for_response(
+    esphome_client: ESPHomeClient, mock_api_client: Mock
+) -> None:
+    """Test a disconnect interrupts writes that wait for the device to respond."""
+    await esphome_client.connect()
+    mock_api_client.bluetooth_gatt_write.side_effect = _hang
+    mock_api_client.bluetooth_gatt_write_descriptor.side_effect = _hang
+    tasks = [
+        asyncio.create_task(esphome_client.write_gatt_char(2, b"\x01", True)),
+        asyncio.create_task(esphome_client.write_gatt_descriptor(3, b"\x01\x00")),
+    ]
+    await asyncio.sleep(0)
+
+    esphome_client._async_ble_device_disconnected()
+    for task in tasks:
+        with pytest.raises(BleakError, match="Disconnected during operation"):
+            await asyncio.wait_for(task, 1)
+
+
+async def test_write_without_response(
+    esphome_client: ESPHomeClient, mock_api_client: Mock
+) -> None:
+    """Test writing without response sends the data as bytes."""
+    await esphome_client.connect()
+    await esphome_client.write_gatt_char(2, bytearray(b"\x01\x02"))
+    mock_api_client.bluetooth_gatt_write.assert_awaited_once_with(
+        esphome_client._address_as_int, 2, b"\x01\x02", False
+    )
+    written = mock_api_client.bluetooth_gatt_write.call_args[0][2]
+    assert type(written) is bytes  # noqa: E721
+
+    esphome_client._async_ble_device_disconnected()
+    with pytest.raises(BleakError, match="Not connected"):
+        await esphome_client.write_gatt_char(2, b"\x01")
+
+
+async def test_unchanged_services_reuse_collection(
+    esphome_client: ESPHomeClient, client_data: ESPHomeClientData
+) -> None:
+    """Test an unchanged service fetch reuses the cached collection."""
+    await esphome_client.connect()
+    services = esphome_client.services
+    assert (
+        client_data.cache.get_gatt_services_cache(esphome_client._address_as_int)
+        is services
+    )
+    await esphome_client.disconnect()
+
+    await esphome_client.connect()
+    assert esphome_client.services is services
+
+
+async def test_mtu_change_rebuilds_services(
+    esphome_client: ESPHomeClient, client_data: ESPHomeClientData
+) -> None:
+    """Test a different MTU rebuilds the collection."""
+    await esphome_client.connect()
+    services = esphome_client.services
+    await esphome_client.disconnect()
+
+    client_data.cache.set_gatt_mtu_cache(esphome_client._address_as_int, 100)
+    await esphome_client.connect()
+    assert esphome_client.services is not services
+    characteristic = esphome_client.services.get_characteristic(2)
+    assert characteristic.max_write_without_response_size == 100 - 3
+
+
+async def test_changed_services_rebuild_collection(
+    esphome_client: ESPHomeClient, mock_api_client: Mock
+) -> None:
+    """Test a different service list from the device rebuilds the collection."""
+    await esphome_client.connect()
+    services = esphome_client.services
+    await esphome_client.disconnect()
+
+    mock_api_client.bluetooth_gatt_get_services.side_effect = (
+        lambda address: make_esphome_services("2a01")
+    )
+    await esphome_client.connect()
+    assert esphome_client.services is not services
+    assert (
+        esphome_client.services.get_characteristic(2).uuid
+        == "00002a01-0000-1000-8000-00805f9b34fb"
+    )
+
+
+async def test_descriptors_resolved_lazily(esphome_client: ESPHomeClient) -> None:
+    """Test descriptors are built on demand and registered on the collection."""
+    await esphome_client.connect()
+    services = esphome_client.services
+    characteristic = services.get_characteristic(2)
+
+    cccd = services.get_descriptor(3)
+    assert cccd is not None
+    assert cccd.uuid == CCCD_UUID
+    assert cccd.characteristic_handle == 2
+    assert services.descriptors == {3: cccd}
+    assert services[3] is cccd
+    assert characteristic.get_descriptor(CCCD_UUID) is cccd
+    assert characteristic.get_descriptor(3) is cccd
+
+
+async def test_add_descriptor_does_not_duplicate(
+    esphome_client: ESPHomeClient,
+) -> None:
+    """Test adding an already known descriptor does not duplicate it."""
+    await esphome_client.connect()
+    characteristic = esphome_client.services.get_characteristic(2)
+    cccd = characteristic.descriptors[0]
+
+    characteristic.add_descriptor(cccd)
+    assert characteristic.descriptors == [cccd]
+
+
+async def test_finalizer_when_not_disconnected(
+    hass: HomeAssistant,
+    client_data: ESPHomeClientData,
+    mock_api_client: Mock,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a client collected while connected warns and aborts notifications."""
+    # Not the fixture since pytest keeps a reference to fixture values
+    esphome_client = ESPHomeClient(
+        BLEDevice(
+            "AA:BB:CC:DD:EE:FF", "device", {"source": "proxy", "address_type": 0}, -60
+        ),
+        client_data=client_data,
+    )
+    await esphome_client.connect()
+    finalizer = esphome_client._finalizer
+    assert finalizer is not None
+    assert finalizer.atexit is False
+    notify_abort = Mock()
+    mock_api_client.bluetooth_gatt_start_notify.return_value = (
+        AsyncMock(),
+        notify_abort,
+    )
+    await esphome_client.start_notify(
+        esphome_client.services.get_characteristic(2), lambda data: None
+    )
+
+    # Drop every reference to the client held by the mocks
+    mock_api_client.reset_mock()
+    client_data.disconnect_callbacks.clear()
+    del esphome_client
+    gc.collect()
+    await hass.async_block_till_done()
+
+    assert not finalizer.alive
+    assert "was not properly disconnected before destruction" in caplog.text
+    notify_abort.assert_called_once()
+
+
+async def test_no_finalizer_after_disconnect(
+    esphome_client: ESPHomeClient, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a cleanly disconnected client does not warn when collected."""
+    await esphome_client.connect()
+    finalizer = esphome_client._finalizer
+    assert finalizer is not None
+    await esphome_client.disconnect()
+
+    assert esphome_client._finalizer is None
+    assert not finalizer.alive
+    assert "was not properly disconnected" not in caplog.text